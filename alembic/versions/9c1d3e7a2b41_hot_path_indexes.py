@@ -0,0 +1,40 @@
+"""Hot path indexes
+
+Revision ID: 9c1d3e7a2b41
+Revises: 574c25264018
+Create Date: 2026-10-18 10:12:03.418211
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c1d3e7a2b41'
+down_revision = '574c25264018'
+branch_labels = None
+depends_on = None
+
+
+OPEN_ROWS = {
+    'sqlite_where': sa.text('fully_invested = 0'),
+    'postgresql_where': sa.text('NOT fully_invested'),
+}
+CLOSED_ROWS = {
+    'sqlite_where': sa.text('fully_invested = 1'),
+    'postgresql_where': sa.text('fully_invested'),
+}
+
+
+def upgrade():
+    op.create_index('ix_charityproject_open_queue', 'charityproject', ['create_date', 'id'], unique=False, **OPEN_ROWS)
+    op.create_index('ix_charityproject_closed', 'charityproject', ['create_date', 'close_date'], unique=False, **CLOSED_ROWS)
+    op.create_index('ix_donation_open_queue', 'donation', ['create_date', 'id'], unique=False, **OPEN_ROWS)
+    op.create_index('ix_donation_user_id_create_date', 'donation', ['user_id', 'create_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_donation_user_id_create_date', table_name='donation')
+    op.drop_index('ix_donation_open_queue', table_name='donation')
+    op.drop_index('ix_charityproject_closed', table_name='charityproject')
+    op.drop_index('ix_charityproject_open_queue', table_name='charityproject')
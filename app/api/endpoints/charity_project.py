@@ -1,3 +1,4 @@
+from functools import partial
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -15,13 +16,13 @@ from app.api.validators import (
 from app.core.db import get_async_session
 from app.core.user import current_superuser
 from app.crud.charity_project import charity_project_crud
-from app.models.donation import Donation
 from app.schemas.charity_project import (
     CharityProjectCreate,
     CharityProjectDB,
     CharityProjectUpdate
 )
-from app.services.invests import get_oldest_unclosed, make_invest
+from app.services.allocator import allocator
+from app.services.invests import invest
 
 
 router = APIRouter()
@@ -51,16 +52,12 @@ async def create_new_charity_project(
         charity_project,
         session
     )
-    unclosed_donations = await get_oldest_unclosed(
-        Donation,
-        session
-    )
     try:
-        await make_invest(
+        await allocator.submit(partial(
+            invest,
             obj_to_invest=new_project,
-            unclosed_objects=unclosed_donations,
             session=session
-        )
+        ))
 
     except IntegrityError:
         await session.rollback()
@@ -1,21 +1,30 @@
+from functools import partial
 from http import HTTPStatus
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import conlist
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constants import DONATION_BATCH_MAX_SIZE
 from app.core.db import get_async_session
 from app.core.user import current_user, current_superuser
 from app.crud.donation import donation_crud
 from app.models.charity_project import CharityProject
 from app.models.user import User
 from app.schemas.donation import (
+    DonationBatchDB,
     DonationCreate,
     DonationDB,
     DonationDBShort
 )
-from app.services.invests import get_oldest_unclosed, make_invest
+from app.services.allocator import allocator
+from app.services.invests import (
+    get_oldest_unclosed,
+    invest,
+    make_batch_invest
+)
 
 
 router = APIRouter()
@@ -43,17 +52,64 @@ async def create_donation(
         user
     )
 
-    unclosed_projects = await get_oldest_unclosed(
+    try:
+        await allocator.submit(partial(
+            invest,
+            obj_to_invest=new_donation,
+            session=session
+        ))
+
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail='Нет проектов для распределения'
+        )
+
+    return new_donation
+
+
+@router.post(
+    '/batch',
+    response_model=list[DonationBatchDB],
+    response_model_exclude_none=True
+)
+async def create_donations_batch(
+    objs_in: conlist(
+        DonationCreate,
+        min_items=1,
+        max_items=DONATION_BATCH_MAX_SIZE
+    ),
+    session: AsyncSession = Depends(
+        get_async_session
+    ),
+    user: User = Depends(
+        current_user
+    )
+):
+    """
+    Endpoint for creating a batch of donations, registred user only.
+    Donations are allocated in one pass and one transaction.
+    """
+
+    new_donations = await donation_crud.create_multi(
+        objs_in,
+        session,
+        user
+    )
+
+    unclosed_projects = get_oldest_unclosed(
         CharityProject,
         session
     )
 
     try:
-        await make_invest(
-            obj_to_invest=new_donation,
+        await allocator.submit(partial(
+            make_batch_invest,
+            objs_to_invest=new_donations,
             unclosed_objects=unclosed_projects,
             session=session
-        )
+        ))
 
     except IntegrityError:
         await session.rollback()
@@ -62,7 +118,7 @@ async def create_donation(
             detail='Нет проектов для распределения'
         )
 
-    return new_donation
+    return new_donations
 
 
 @router.get(
@@ -2,4 +2,6 @@ DEFAULT_INVESTED_AMOUNT = 0
 NAME_MAX_LENGTH = 100
 NAME_MIN_LENGTH = 1
 PASSWORD_MIN_LENGTH = 3
-LOGGING_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
\ No newline at end of file
+LOGGING_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+INVEST_CHUNK_SIZE = 10
+DONATION_BATCH_MAX_SIZE = 10000
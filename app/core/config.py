@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     auth_provider_x509_cert_url: Optional[str] = None
     client_x509_cert_url: Optional[str] = None
     email: Optional[str] = None
+    open_queue_index: bool = False
 
     class Config:
         env_file = '.env'
@@ -7,6 +7,7 @@ from app.core.config import settings
 from app.core.db import get_async_session
 from app.core.user import get_user_db, get_user_manager
 from app.schemas.user import UserCreate
+from app.services.open_queue import open_queue_index
 
 get_async_session_context = contextlib.asynccontextmanager(get_async_session)
 get_user_db_context = contextlib.asynccontextmanager(get_user_db)
@@ -40,4 +41,10 @@ async def create_first_superuser():
             email=settings.first_superuser_email,
             password=settings.first_superuser_password,
             is_superuser=True,
-        )
\ No newline at end of file
+        )
+
+
+async def warm_open_queue_index():
+    if settings.open_queue_index:
+        async with get_async_session_context() as session:
+            await open_queue_index.load(session)
@@ -52,6 +52,27 @@ class CRUDBase:
 
         return db_obj
 
+    async def create_multi(
+        self,
+        objs_in: list,
+        session: AsyncSession,
+        user: Optional[User] = None
+    ):
+        """Adds all objects in one flush, leaving the commit to caller."""
+        db_objs = []
+        for obj_in in objs_in:
+            obj_in_data = obj_in.dict()
+
+            if user is not None:
+                obj_in_data['user_id'] = user.id
+
+            db_objs.append(self.model(**obj_in_data))
+
+        session.add_all(db_objs)
+        await session.flush()
+
+        return db_objs
+
     async def update(
         self,
         db_obj,
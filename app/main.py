@@ -2,8 +2,9 @@ from fastapi import FastAPI
 import uvicorn
 
 from app.core.config import settings
-from app.core.init_db import create_first_superuser
+from app.core.init_db import create_first_superuser, warm_open_queue_index
 from app.api.routers import main_router
+from app.services.allocator import allocator
 
 
 app = FastAPI(title=settings.app_title)
@@ -13,6 +14,13 @@ app.include_router(main_router)
 @app.on_event('startup')
 async def startup():
     await create_first_superuser()
+    await warm_open_queue_index()
+    await allocator.start()
+
+
+@app.on_event('shutdown')
+async def shutdown():
+    await allocator.stop()
 
 
 if __name__ == '__main__':
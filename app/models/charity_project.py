@@ -3,6 +3,8 @@ from sqlalchemy import Column, String, Text
 from app.models.base import DBObject
 from app.models.constraints import (check_description_length,
                                     check_full_amount_is_positive)
+from app.models.indexes import (ix_charityproject_closed,
+                                ix_charityproject_open_queue)
 
 
 class CharityProject(DBObject):
@@ -20,7 +22,9 @@ class CharityProject(DBObject):
 
     __table_args__ = (
         check_description_length,
-        check_full_amount_is_positive
+        check_full_amount_is_positive,
+        ix_charityproject_open_queue,
+        ix_charityproject_closed
     )
 
     def __repr__(self):
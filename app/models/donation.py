@@ -1,6 +1,8 @@
 from sqlalchemy import Column, ForeignKey, Text, Integer
 
 from app.models.base import DBObject
+from app.models.indexes import (ix_donation_open_queue,
+                                ix_donation_user_id_create_date)
 
 
 class Donation(DBObject):
@@ -15,6 +17,11 @@ class Donation(DBObject):
         nullable=True
     )
 
+    __table_args__ = (
+        ix_donation_open_queue,
+        ix_donation_user_id_create_date
+    )
+
     def __repr__(self):
         return (
             f'Пожертвование на сумму {self.full_amount},\n'
@@ -0,0 +1,24 @@
+from sqlalchemy import Index, text
+
+
+OPEN_ROWS = {
+    'sqlite_where': text('fully_invested = 0'),
+    'postgresql_where': text('NOT fully_invested'),
+}
+CLOSED_ROWS = {
+    'sqlite_where': text('fully_invested = 1'),
+    'postgresql_where': text('fully_invested'),
+}
+
+ix_charityproject_open_queue = Index(
+    'ix_charityproject_open_queue', 'create_date', 'id', **OPEN_ROWS
+)
+ix_charityproject_closed = Index(
+    'ix_charityproject_closed', 'create_date', 'close_date', **CLOSED_ROWS
+)
+ix_donation_open_queue = Index(
+    'ix_donation_open_queue', 'create_date', 'id', **OPEN_ROWS
+)
+ix_donation_user_id_create_date = Index(
+    'ix_donation_user_id_create_date', 'user_id', 'create_date'
+)
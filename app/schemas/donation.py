@@ -69,13 +69,9 @@ class DonationDBShort(DonationBase):
         }
 
 
-class DonationDB(DonationDBShort):
-    """Full object representation for superusers."""
+class DonationBatchDB(DonationDBShort):
+    """Donation representation with allocation result for batches."""
 
-    user_id: Optional[int] = Field(
-        None,
-        title='ID пожертвовавшего'
-    )
     invested_amount: int = Field(
         DEFAULT_INVESTED_AMOUNT,
         title='Израсходовано'
@@ -89,6 +85,19 @@ class DonationDB(DonationDBShort):
         title='Дата совершения пожертвования'
     )
 
+    class Config:
+        title = 'Схема пожертвования из пакета'
+        orm_mode = True
+
+
+class DonationDB(DonationBatchDB):
+    """Full object representation for superusers."""
+
+    user_id: Optional[int] = Field(
+        None,
+        title='ID пожертвовавшего'
+    )
+
     class Config:
         title = 'Схема пожертвования для администратора'
         orm_mode = True
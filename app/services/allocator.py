@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+
+class AllocationActor:
+    """
+    Single asyncio task that owns the queue of allocation jobs.
+    Jobs are applied strictly one at a time in arrival order, so two
+    requests never read and top up the same open object concurrently.
+    Serialization holds within one process only.
+    """
+
+    def __init__(self) -> None:
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the worker after the already queued jobs are applied."""
+        if not self.is_running:
+            return
+        await self._queue.put((None, None))
+        await self._worker
+        self._queue = None
+        self._worker = None
+
+    async def submit(self, job: Callable[[], Awaitable[Any]]) -> Any:
+        """Queues the job and waits for its result."""
+        if not self.is_running:
+            return await job()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((job, future))
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            job, future = await self._queue.get()
+            if job is None:
+                return
+            if future.cancelled():
+                continue
+            try:
+                result = await job()
+            except Exception as error:
+                if not future.cancelled():
+                    future.set_exception(error)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
+
+allocator = AllocationActor()
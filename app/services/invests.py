@@ -1,24 +1,61 @@
 from datetime import datetime
-from typing import Union, Optional
+from typing import AsyncIterator, Union
 
-from sqlalchemy import select
+from sqlalchemy import and_, bindparam, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constants import INVEST_CHUNK_SIZE
+from app.core.config import settings
 from app.models.charity_project import CharityProject
 from app.models.donation import Donation
+from app.services.open_queue import open_queue_index
+
+
+def get_counterparty_model(
+    obj: Union[CharityProject, Donation]
+) -> Union[type[CharityProject], type[Donation]]:
+    """Function for getting the model which object is invested with."""
+    if isinstance(obj, Donation):
+        return CharityProject
+    return Donation
 
 
 async def get_oldest_unclosed(
     model: Union[CharityProject, Donation],
-    session: AsyncSession
-) -> Optional[Union[CharityProject, Donation]]:
-    """Function for getting all unclosed objects of model."""
-    db_obj = await session.execute(
-        select(model).where(
-            model.fully_invested == 0
-        ).order_by(model.create_date)
-    )
-    return db_obj.scalars().all()
+    session: AsyncSession,
+    chunk_size: int = INVEST_CHUNK_SIZE
+) -> AsyncIterator[Union[CharityProject, Donation]]:
+    """
+    Function for lazy iterating over unclosed objects of model.
+    Objects are fetched oldest first in small keyset chunks,
+    so the caller pays only for the rows it actually consumes.
+    """
+    last_obj = None
+    while True:
+        query = select(model).where(
+            ~model.fully_invested
+        ).order_by(
+            model.create_date, model.id
+        ).limit(chunk_size)
+        if last_obj is not None:
+            query = query.where(
+                or_(
+                    model.create_date > last_obj.create_date,
+                    and_(
+                        model.create_date == last_obj.create_date,
+                        model.id > last_obj.id
+                    )
+                )
+            )
+        db_objs = await session.execute(query)
+        chunk = db_objs.scalars().all()
+
+        for db_obj in chunk:
+            yield db_obj
+
+        if len(chunk) < chunk_size:
+            return
+        last_obj = chunk[-1]
 
 
 def close_object(
@@ -30,33 +67,147 @@ def close_object(
     return obj
 
 
+def transfer_funds(
+    obj_to_invest: Union[CharityProject, Donation],
+    invest_object: Union[CharityProject, Donation]
+) -> int:
+    """Function for moving free funds between two objects."""
+    amount = min(
+        obj_to_invest.full_amount - obj_to_invest.invested_amount,
+        invest_object.full_amount - invest_object.invested_amount
+    )
+    for obj in (obj_to_invest, invest_object):
+        obj.invested_amount += amount
+        if obj.invested_amount == obj.full_amount:
+            close_object(obj)
+    return amount
+
+
 async def make_invest(
     obj_to_invest: Union[CharityProject, Donation],
-    unclosed_objects: Optional[list[Union[CharityProject, Donation]]],
+    unclosed_objects: AsyncIterator[Union[CharityProject, Donation]],
     session: AsyncSession
 ):
     """Function for investing into unclosed objects."""
-    if unclosed_objects:
-        for invest_object in unclosed_objects:
-            invest_remainder = (
-                obj_to_invest.full_amount - obj_to_invest.invested_amount
-            )
-            required_invest = (
-                invest_object.full_amount - invest_object.invested_amount
+    async for invest_object in unclosed_objects:
+        transfer_funds(obj_to_invest, invest_object)
+        if obj_to_invest.fully_invested:
+            break
+
+    await session.commit()
+    await session.refresh(obj_to_invest)
+
+    return obj_to_invest
+
+
+async def make_batch_invest(
+    objs_to_invest: list[Union[CharityProject, Donation]],
+    unclosed_objects: AsyncIterator[Union[CharityProject, Donation]],
+    session: AsyncSession
+):
+    """
+    Function for investing a batch of objects in one ordered pass.
+    Each unclosed object is read once and filled by the batch objects
+    in their order, then everything is committed together.
+    """
+    pending = iter(objs_to_invest)
+    obj_to_invest = next(pending, None)
+    async for invest_object in unclosed_objects:
+        while obj_to_invest is not None and not invest_object.fully_invested:
+            transfer_funds(obj_to_invest, invest_object)
+            if obj_to_invest.fully_invested:
+                obj_to_invest = next(pending, None)
+        if obj_to_invest is None:
+            break
+
+    obj_ids = [obj.id for obj in objs_to_invest]
+    await session.commit()
+    if obj_ids:
+        model = type(objs_to_invest[0])
+        await session.execute(
+            select(model).where(model.id.in_(obj_ids))
+        )
+
+    return objs_to_invest
+
+
+async def make_indexed_invest(
+    obj_to_invest: Union[CharityProject, Donation],
+    session: AsyncSession
+):
+    """
+    Function for investing through the in-memory open queue index.
+    Counterparties are updated with one executemany UPDATE guarded by
+    the remainders the index expects; any mismatch means the index has
+    drifted, so it is rebuilt and the regular streaming path is used.
+    """
+    model = get_counterparty_model(obj_to_invest)
+    queue = open_queue_index.queues[model]
+    steps = queue.plan(
+        obj_to_invest.full_amount - obj_to_invest.invested_amount
+    )
+    if steps:
+        now = datetime.now()
+        table = model.__table__
+        result = await session.execute(
+            update(table).where(
+                table.c.id == bindparam('b_id'),
+                ~table.c.fully_invested,
+                table.c.full_amount - table.c.invested_amount == (
+                    bindparam('b_remaining')
+                )
+            ).values(
+                invested_amount=table.c.invested_amount + bindparam(
+                    'b_invested'
+                ),
+                fully_invested=bindparam('b_closed'),
+                close_date=bindparam('b_close_date')
+            ),
+            [
+                {
+                    'b_id': obj_id,
+                    'b_remaining': remaining,
+                    'b_invested': invested,
+                    'b_closed': invested == remaining,
+                    'b_close_date': now if invested == remaining else None
+                }
+                for obj_id, remaining, invested in steps
+            ]
+        )
+        if result.rowcount != len(steps):
+            await session.rollback()
+            await open_queue_index.load(session)
+            await session.refresh(obj_to_invest)
+            return await make_invest(
+                obj_to_invest,
+                get_oldest_unclosed(model, session),
+                session
             )
-            if invest_remainder >= required_invest:
-                obj_to_invest.invested_amount += required_invest
-                invest_object.invested_amount = invest_object.full_amount
-                close_object(invest_object)
-                if invest_remainder == required_invest:
-                    close_object(obj_to_invest)
-            else:
-                invest_object.invested_amount += invest_remainder
-                obj_to_invest.invested_amount = obj_to_invest.full_amount
-                close_object(obj_to_invest)
-                break
-
-        await session.commit()
-        await session.refresh(obj_to_invest)
+        obj_to_invest.invested_amount += sum(
+            invested for _, _, invested in steps
+        )
+        if obj_to_invest.invested_amount == obj_to_invest.full_amount:
+            close_object(obj_to_invest)
+
+    await session.commit()
+    queue.apply(steps)
+    await session.refresh(obj_to_invest)
 
     return obj_to_invest
+
+
+async def invest(
+    obj_to_invest: Union[CharityProject, Donation],
+    session: AsyncSession
+):
+    """Function for investing a new object with the configured engine."""
+    if settings.open_queue_index:
+        if not open_queue_index.is_ready:
+            await open_queue_index.load(session)
+        return await make_indexed_invest(obj_to_invest, session)
+
+    return await make_invest(
+        obj_to_invest,
+        get_oldest_unclosed(get_counterparty_model(obj_to_invest), session),
+        session
+    )
@@ -0,0 +1,145 @@
+import bisect
+from datetime import datetime
+from typing import Optional, Union
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.charity_project import CharityProject
+from app.models.donation import Donation
+
+
+OPEN_QUEUE_CHANGES = 'open_queue_changes'
+
+
+class OpenQueue:
+    """Remainders of open objects of one model, oldest first."""
+
+    def __init__(self) -> None:
+        self.keys: list[tuple[datetime, int]] = []
+        self.entries: dict[int, tuple[datetime, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def put(self, obj_id: int, create_date: datetime, remaining: int):
+        if obj_id not in self.entries:
+            bisect.insort(self.keys, (create_date, obj_id))
+        self.entries[obj_id] = (create_date, remaining)
+
+    def discard(self, obj_id: int):
+        entry = self.entries.pop(obj_id, None)
+        if entry is None:
+            return
+        position = bisect.bisect_left(self.keys, (entry[0], obj_id))
+        del self.keys[position]
+
+    def plan(self, amount: int) -> list[tuple[int, int, int]]:
+        """Returns (id, remaining, invested) steps covering the amount."""
+        steps = []
+        for create_date, obj_id in self.keys:
+            if amount == 0:
+                break
+            remaining = self.entries[obj_id][1]
+            invested = min(amount, remaining)
+            steps.append((obj_id, remaining, invested))
+            amount -= invested
+        return steps
+
+    def apply(self, steps: list[tuple[int, int, int]]):
+        for obj_id, remaining, invested in steps:
+            if invested == remaining:
+                self.discard(obj_id)
+            else:
+                create_date = self.entries[obj_id][0]
+                self.entries[obj_id] = (create_date, remaining - invested)
+
+
+class OpenQueueIndex:
+    """
+    In-memory index of open projects and donations remainders.
+    Kept write-through from committed ORM flushes, rebuilt on drift.
+    """
+
+    def __init__(self) -> None:
+        self.queues: dict[type, OpenQueue] = {}
+        self.is_ready = False
+
+    def reset(self):
+        self.queues = {}
+        self.is_ready = False
+
+    async def load(self, session: AsyncSession):
+        queues = {}
+        for model in (CharityProject, Donation):
+            queue = OpenQueue()
+            rows = await session.stream(
+                select(
+                    model.id,
+                    model.create_date,
+                    model.full_amount - model.invested_amount
+                ).where(
+                    ~model.fully_invested
+                ).order_by(model.create_date, model.id)
+            )
+            async for obj_id, create_date, remaining in rows:
+                queue.keys.append((create_date, obj_id))
+                queue.entries[obj_id] = (create_date, remaining)
+            queues[model] = queue
+        self.queues = queues
+        self.is_ready = True
+
+    def track(
+        self,
+        model: type,
+        obj_id: int,
+        create_date: Optional[datetime],
+        remaining: Optional[int]
+    ):
+        """Puts an open object into its queue or drops a closed one."""
+        queue = self.queues[model]
+        if remaining is None:
+            queue.discard(obj_id)
+        else:
+            queue.put(obj_id, create_date, remaining)
+
+
+open_queue_index = OpenQueueIndex()
+
+
+def open_queue_snapshot(obj: Union[CharityProject, Donation]) -> tuple:
+    if obj.fully_invested:
+        return type(obj), obj.id, None, None
+    return (
+        type(obj),
+        obj.id,
+        obj.create_date,
+        obj.full_amount - obj.invested_amount
+    )
+
+
+@event.listens_for(Session, 'after_flush')
+def collect_open_queue_changes(session: Session, flush_context):
+    if not open_queue_index.is_ready:
+        return
+    changes = session.info.setdefault(OPEN_QUEUE_CHANGES, [])
+    for obj in session.new.union(session.dirty):
+        if isinstance(obj, (CharityProject, Donation)):
+            changes.append(open_queue_snapshot(obj))
+    for obj in session.deleted:
+        if isinstance(obj, (CharityProject, Donation)):
+            changes.append((type(obj), obj.id, None, None))
+
+
+@event.listens_for(Session, 'after_commit')
+def apply_open_queue_changes(session: Session):
+    changes = session.info.pop(OPEN_QUEUE_CHANGES, [])
+    if open_queue_index.is_ready:
+        for change in changes:
+            open_queue_index.track(*change)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def drop_open_queue_changes(session: Session, previous_transaction):
+    session.info.pop(OPEN_QUEUE_CHANGES, None)
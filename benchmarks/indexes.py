@@ -0,0 +1,155 @@
+"""
+Query plans and timings of the hot queries with and without indexes.
+
+Usage (from the project root):
+
+    python -m benchmarks.indexes --rows 1000000
+
+Seeds a throwaway SQLite database with ``--rows`` projects and
+``--rows`` donations (all but ``--open`` of them closed), then prints
+``EXPLAIN QUERY PLAN`` and the best of ``--repeat`` runs for every query,
+first without the hot path indexes and then with them.
+"""
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, extract, select
+from sqlalchemy.dialects import sqlite
+
+from app.core.base import Base
+from app.models import CharityProject, Donation
+from app.models.indexes import (ix_charityproject_closed,
+                                ix_charityproject_open_queue,
+                                ix_donation_open_queue,
+                                ix_donation_user_id_create_date)
+
+
+INDEXES = (
+    ix_charityproject_open_queue,
+    ix_charityproject_closed,
+    ix_donation_open_queue,
+    ix_donation_user_id_create_date,
+)
+USERS = 1000
+START_DATE = datetime(2020, 1, 1)
+
+
+def hot_queries(chunk_size: int) -> dict:
+    """Hot queries of the app, compiled for SQLite with literal binds."""
+
+    queries = {
+        'open projects queue': select(CharityProject).where(
+            ~CharityProject.fully_invested
+        ).order_by(
+            CharityProject.create_date, CharityProject.id
+        ).limit(chunk_size),
+        'open donations queue': select(Donation).where(
+            ~Donation.fully_invested
+        ).order_by(
+            Donation.create_date, Donation.id
+        ).limit(chunk_size),
+        'user donations': select(Donation).where(
+            Donation.user_id == USERS // 2
+        ),
+        'projects by completion rate': select(
+            CharityProject,
+            (
+                extract('epoch', CharityProject.close_date) -
+                extract('epoch', CharityProject.create_date)
+            ).label('duration')
+        ).where(CharityProject.fully_invested).order_by('duration'),
+    }
+    return {
+        name: str(query.compile(
+            dialect=sqlite.dialect(),
+            compile_kwargs={'literal_binds': True}
+        ))
+        for name, query in queries.items()
+    }
+
+
+def seed_rows(rows: int, open_rows: int, with_user: bool):
+    """Generates closed rows first and the open backlog last."""
+
+    for number in range(rows):
+        create_date = START_DATE + timedelta(minutes=number)
+        full_amount = random.randint(1, 10000)
+        if number < rows - open_rows:
+            row = (full_amount, full_amount, True, create_date,
+                   create_date + timedelta(hours=random.randint(1, 1000)))
+        else:
+            row = (full_amount, 0, False, create_date, None)
+        if with_user:
+            yield row + (random.randint(1, USERS), None)
+        else:
+            yield row + (f'project_{number}', 'description')
+
+
+def seed(connection, rows: int, open_rows: int):
+    columns = ('full_amount, invested_amount, fully_invested, '
+               'create_date, close_date')
+    connection.executemany(
+        f'INSERT INTO charityproject ({columns}, name, description) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+        seed_rows(rows, open_rows, with_user=False)
+    )
+    connection.executemany(
+        f'INSERT INTO donation ({columns}, user_id, comment) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+        seed_rows(rows, open_rows, with_user=True)
+    )
+    connection.commit()
+
+
+def measure(connection, queries: dict, repeat: int):
+    for name, query in queries.items():
+        plan = connection.execute(f'EXPLAIN QUERY PLAN {query}').fetchall()
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            connection.execute(query).fetchall()
+            timings.append(time.perf_counter() - started)
+        print(f'  {name}: {min(timings) * 1000:.2f} ms')
+        for row in plan:
+            print(f'      {row[-1]}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--open', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--chunk-size', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f'sqlite:///{Path(tmp_dir) / "bench.db"}')
+        Base.metadata.create_all(engine)
+        connection = engine.raw_connection()
+        for index in INDEXES:
+            connection.execute(f'DROP INDEX {index.name}')
+
+        print(f'Seeding {args.rows} projects and donations...')
+        seed(connection, args.rows, args.open)
+        connection.execute('ANALYZE')
+        queries = hot_queries(args.chunk_size)
+
+        print('Without indexes:')
+        measure(connection, queries, args.repeat)
+
+        with engine.begin() as sa_connection:
+            for index in INDEXES:
+                index.create(sa_connection)
+        connection.execute('ANALYZE')
+        print('With indexes:')
+        measure(connection, queries, args.repeat)
+        connection.close()
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
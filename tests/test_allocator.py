@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from app.services.allocator import AllocationActor
+
+
+async def test_allocation_jobs_are_serialized():
+    actor = AllocationActor()
+    await actor.start()
+    running = []
+    applied = []
+
+    async def job(number):
+        running.append(number)
+        assert len(running) == 1, (
+            'Задачи распределения не должны выполняться одновременно.'
+        )
+        await asyncio.sleep(0)
+        running.remove(number)
+        applied.append(number)
+        return number
+
+    results = await asyncio.gather(
+        *(actor.submit(lambda number=number: job(number))
+          for number in range(20))
+    )
+    await actor.stop()
+    assert results == list(range(20))
+    assert applied == list(range(20)), (
+        'Задачи распределения должны применяться в порядке поступления.'
+    )
+
+
+async def test_allocation_job_error_is_returned_to_caller():
+    actor = AllocationActor()
+    await actor.start()
+
+    async def failing_job():
+        raise ValueError('boom')
+
+    async def job():
+        return 'ok'
+
+    with pytest.raises(ValueError):
+        await actor.submit(failing_job)
+    assert await actor.submit(job) == 'ok', (
+        'Ошибка одной задачи не должна останавливать обработчик очереди.'
+    )
+    await actor.stop()
+    assert not actor.is_running
@@ -197,3 +197,40 @@ def test_create_donation_check_create_date(user_client):
         'При создании двух пожертвований с паузой (в 1 секунду, например) у '
         'них должны быть разные `create_date`'
     )
+
+
+def test_create_donations_batch(user_client, charity_project,
+                                charity_project_nunchaku):
+    response = user_client.post('/donation/batch', json=[
+        {'full_amount': 600000},
+        {'full_amount': 600000, 'comment': 'Second'},
+    ])
+    assert response.status_code == 200, (
+        'При создании пакета пожертвований должен возвращаться '
+        'статус-код 200.'
+    )
+    data = response.json()
+    assert [
+        (donation['id'], donation['invested_amount'],
+         donation['fully_invested'])
+        for donation in data
+    ] == [(1, 600000, True), (2, 600000, True)], (
+        'Пожертвования из пакета должны распределяться по проектам '
+        'в порядке очереди.'
+    )
+    assert 'user_id' not in data[0]
+    assert charity_project.fully_invested
+    assert charity_project_nunchaku.invested_amount == 200000
+
+
+@pytest.mark.parametrize('json', [
+    [],
+    [{'full_amount': 10}, {'full_amount': -1}],
+    {'full_amount': 10},
+])
+def test_create_donations_batch_incorrect(user_client, json):
+    response = user_client.post('/donation/batch', json=json)
+    assert response.status_code == 422, (
+        'При некорректном теле POST-запроса к эндпоинту `/donation/batch` '
+        'должен вернуться статус-код 422.'
+    )
@@ -55,3 +55,25 @@ def test_donation_to_little_invest_project(
     )
     assert not charity_project_nunchaku.fully_invested, common_asser_msg
     assert charity_project_nunchaku.invested_amount == 0, common_asser_msg
+
+
+def test_donation_spans_several_chunks_of_projects(user_client, mixer):
+    projects = [
+        mixer.blend(
+            'app.models.charity_project.CharityProject',
+            name=f'project_{number}',
+            description='Small project',
+            full_amount=10,
+        )
+        for number in range(25)
+    ]
+    response = user_client.post('/donation/', json={
+        'full_amount': 245,
+    })
+    assert response.status_code == 200
+    assert all(project.fully_invested for project in projects[:24]), (
+        'Пожертвование должно распределяться по всем открытым проектам '
+        'по очереди, пока не будет израсходована вся сумма.'
+    )
+    assert not projects[24].fully_invested
+    assert projects[24].invested_amount == 5
@@ -0,0 +1,75 @@
+import pytest
+from conftest import TEST_DB
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.models import CharityProject, Donation
+from app.services.open_queue import open_queue_index
+
+
+@pytest.fixture
+def open_queue_enabled(monkeypatch):
+    monkeypatch.setattr(settings, 'open_queue_index', True)
+    yield open_queue_index
+    open_queue_index.reset()
+
+
+def test_indexed_invest(user_client, open_queue_enabled, charity_project,
+                        charity_project_nunchaku):
+    user_client.post('/donation/', json={'full_amount': 500000})
+    assert open_queue_enabled.is_ready, (
+        'Индекс открытых объектов должен загружаться при первом '
+        'распределении.'
+    )
+    user_client.post('/donation/', json={'full_amount': 700000})
+    assert charity_project.fully_invested
+    assert charity_project_nunchaku.invested_amount == 200000
+    project_queue = open_queue_enabled.queues[CharityProject]
+    assert list(project_queue.entries) == [charity_project_nunchaku.id], (
+        'Закрытые проекты должны удаляться из индекса открытых объектов.'
+    )
+    assert project_queue.entries[charity_project_nunchaku.id][1] == 4800000
+    assert not open_queue_enabled.queues[Donation], (
+        'Полностью распределённые пожертвования не должны оставаться '
+        'в индексе открытых объектов.'
+    )
+
+
+def test_indexed_invest_tracks_new_objects(user_client, superuser_client,
+                                           open_queue_enabled):
+    superuser_client.post('/charity_project/', json={
+        'name': 'First',
+        'description': 'First project',
+        'full_amount': 100,
+    })
+    superuser_client.post('/charity_project/', json={
+        'name': 'Second',
+        'description': 'Second project',
+        'full_amount': 100,
+    })
+    response = user_client.post('/donation/', json={'full_amount': 150})
+    assert response.status_code == 200
+    data = superuser_client.get('/charity_project/').json()
+    assert [project['invested_amount'] for project in data] == [100, 50]
+
+
+def test_indexed_invest_rebuilds_on_drift(user_client, open_queue_enabled,
+                                          charity_project,
+                                          charity_project_nunchaku):
+    user_client.post('/donation/', json={'full_amount': 10})
+    engine = create_engine(f'sqlite:///{str(TEST_DB)}')
+    with engine.begin() as connection:
+        connection.execute(text(
+            'UPDATE charityproject SET invested_amount = 999990 '
+            'WHERE id = :id'
+        ), {'id': charity_project.id})
+    engine.dispose()
+
+    user_client.post('/donation/', json={'full_amount': 50})
+    assert charity_project.fully_invested, (
+        'При расхождении индекса с БД распределение должно идти по '
+        'актуальным данным.'
+    )
+    assert charity_project_nunchaku.invested_amount == 40
+    project_queue = open_queue_enabled.queues[CharityProject]
+    assert project_queue.entries[charity_project_nunchaku.id][1] == 4999960